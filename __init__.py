@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_API_KEY, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.device_registry import DeviceEntry
@@ -64,6 +64,28 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # Return true to denote a successful setup.
     return True
 
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Migrate old config entries."""
+    if config_entry.version > 1:
+        # Downgraded from a future version
+        return False
+
+    if config_entry.minor_version < 2:
+        # The options form used to store a placeholder API key in the options.
+        # The key is only read from the entry data, so drop the stale option.
+        options = {
+            key: value
+            for key, value in config_entry.options.items()
+            if key != CONF_API_KEY
+        }
+        hass.config_entries.async_update_entry(
+            config_entry, options=options, minor_version=2
+        )
+        _LOGGER.debug("Migrated config entry to version 1.2")
+
+    return True
+
+
 async def _async_update_listener(hass: HomeAssistant, config_entry):
     """Handle config options update."""
     # Reload the integration when the options change.
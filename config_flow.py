@@ -1,6 +1,7 @@
 """Config flow for Vitesy integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -23,8 +24,33 @@ from .const import (
     DEFAULT_POLLING_INTERVAL,
     MIN_POLLING_INTERVAL,
     MAX_POLLING_INTERVAL,
+    CONF_FLEET_MODE,
+    DEFAULT_FLEET_MODE,
+    CONF_REQUESTS_PER_HOUR,
+    DEFAULT_REQUESTS_PER_HOUR,
+    MIN_REQUESTS_PER_HOUR,
+    MAX_REQUESTS_PER_HOUR,
+    CONF_MAX_DATA_AGE,
+    DEFAULT_MAX_DATA_AGE,
+    MIN_MAX_DATA_AGE,
+    MAX_MAX_DATA_AGE,
+    CONF_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    MAX_TEMPERATURE_DEADBAND,
+    CONF_DOOR_DEADBAND,
+    DEFAULT_DOOR_DEADBAND,
+    MAX_DOOR_DEADBAND,
+    CONF_BATTERY_DEADBAND,
+    DEFAULT_BATTERY_DEADBAND,
+    MAX_BATTERY_DEADBAND,
+    CONF_MIN_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    MAX_MIN_PUBLISH_INTERVAL,
+    VALIDATION_TIMEOUT,
 )
+from .coordinator import async_cache_inventory
 from vitesy.client import VitesyClient
+from vitesy.exceptions import AuthenticationError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,37 +75,68 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def entry_title(api_key: str) -> str:
+    """Return the title of the config entry for api_key, also used as its unique id."""
+    return f"Vitesy - {api_key}"
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect to Vitesy.
 
+    The device inventory fetched here is cached so the first coordinator
+    refresh does not have to fetch it again.
+
     Args:
         hass: The Home Assistant instance.
         data: The user input data containing the API key.
 
     Returns:
-        Dict containing the title for the config entry.
+        Dict containing the title for the config entry and a summary of the
+        discovered devices (count, models and firmware versions).
 
     Raises:
         CannotConnect: Error connecting to Vitesy API.
         InvalidAuth: Invalid API key.
+        ValidationTimeout: The Vitesy API did not answer in time.
     """
     api = VitesyClient(data[CONF_API_KEY])
-    
+
     try:
-        devices = await hass.async_add_executor_job(api.get_devices)
-        if not devices:
-            _LOGGER.warning("No Vitesy devices found")
-            
+        async with asyncio.timeout(VALIDATION_TIMEOUT):
+            devices = await hass.async_add_executor_job(api.get_devices)
+    except TimeoutError as err:
+        raise ValidationTimeout from err
+    except AuthenticationError as err:
+        raise InvalidAuth from err
     except Exception as err:
         _LOGGER.exception("Unexpected error occurred")
         raise CannotConnect from err
-    return {"title": f"Vitesy - {data[CONF_API_KEY]}"}
+
+    devices = devices or []
+    if not devices:
+        _LOGGER.warning("No Vitesy devices found")
+    async_cache_inventory(hass, data[CONF_API_KEY], devices)
+
+    inventory = {
+        "devices": len(devices),
+        "models": sorted({str(device.get("model")) for device in devices if device.get("model")}),
+        "firmware": sorted(
+            {
+                str(device.get("firmware_version"))
+                for device in devices
+                if device.get("firmware_version")
+            }
+        ),
+    }
+    _LOGGER.debug("Vitesy inventory: %s", inventory)
+    return {"title": entry_title(data[CONF_API_KEY]), "inventory": inventory}
 
 
 class VitesyConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Vitesy integration."""
 
     VERSION = 1
+    MINOR_VERSION = 2
     _input_data: dict[str, Any]
 
     @staticmethod
@@ -108,6 +165,8 @@ class VitesyConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
+            except ValidationTimeout:
+                errors["base"] = "timeout_connect"
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
@@ -164,9 +223,51 @@ class VitesyOptionsFlowHandler(OptionsFlow):
         Returns:
             The result of the options flow step.
         """
+        errors: dict[str, str] = {}
+        # The API key lives in the entry data, it is only shown on this form
+        current_api_key = self.config_entry.data.get(CONF_API_KEY)
+
         if user_input is not None:
-            options = self.config_entry.options | user_input
-            return self.async_create_entry(title="", data=options)
+            info = None
+            if user_input[CONF_API_KEY] != current_api_key:
+                # The unique id is built from the API key, so a key used by another entry is rejected
+                title = entry_title(user_input[CONF_API_KEY])
+                if any(
+                    entry.unique_id == title
+                    for entry in self.hass.config_entries.async_entries(DOMAIN)
+                    if entry.entry_id != self.config_entry.entry_id
+                ):
+                    errors["base"] = "already_configured"
+                else:
+                    # A new API key is validated the same way as in the config flow
+                    try:
+                        info = await validate_input(self.hass, user_input)
+                    except CannotConnect:
+                        errors["base"] = "cannot_connect"
+                    except InvalidAuth:
+                        errors["base"] = "invalid_auth"
+                    except ValidationTimeout:
+                        errors["base"] = "timeout_connect"
+                    except Exception:
+                        _LOGGER.exception("Unexpected exception")
+                        errors["base"] = "unknown"
+
+            if "base" not in errors:
+                options = {
+                    key: value
+                    for key, value in (self.config_entry.options | user_input).items()
+                    if key != CONF_API_KEY
+                }
+                if info is not None:
+                    # Update data and options together so the entry is reloaded only once
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry,
+                        data={**self.config_entry.data, CONF_API_KEY: user_input[CONF_API_KEY]},
+                        options=options,
+                        title=info["title"],
+                        unique_id=info["title"],
+                    )
+                return self.async_create_entry(title="", data=options)
 
         # It is recommended to prepopulate options fields with default values if available.
         # These will be the same default values you use on your coordinator for setting variable values
@@ -175,7 +276,7 @@ class VitesyOptionsFlowHandler(OptionsFlow):
             {
                 vol.Required(
                     CONF_API_KEY,
-                    default=self.options.get(CONF_API_KEY, "xxxx"),
+                    default=current_api_key,
                 ): str,
                 vol.Optional(
                     CONF_POLLING_INTERVAL,
@@ -191,10 +292,79 @@ class VitesyOptionsFlowHandler(OptionsFlow):
                         max=MAX_POLLING_INTERVAL,
                     )
                 ),
+                vol.Optional(
+                    CONF_FLEET_MODE,
+                    default=self.config_entry.options.get(CONF_FLEET_MODE, DEFAULT_FLEET_MODE),
+                ): bool,
+                vol.Optional(
+                    CONF_REQUESTS_PER_HOUR,
+                    default=self.config_entry.options.get(
+                        CONF_REQUESTS_PER_HOUR, DEFAULT_REQUESTS_PER_HOUR
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(
+                        min=MIN_REQUESTS_PER_HOUR,
+                        max=MAX_REQUESTS_PER_HOUR,
+                    )
+                ),
+                vol.Optional(
+                    CONF_MAX_DATA_AGE,
+                    default=self.config_entry.options.get(
+                        CONF_MAX_DATA_AGE, DEFAULT_MAX_DATA_AGE
+                    ),
+                    description={"suffix": "seconds"},
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(
+                        min=MIN_MAX_DATA_AGE,
+                        max=MAX_MAX_DATA_AGE,
+                    )
+                ),
+                vol.Optional(
+                    CONF_TEMPERATURE_DEADBAND,
+                    default=self.config_entry.options.get(
+                        CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                    ),
+                    description={"suffix": "°C"},
+                ): vol.All(
+                    vol.Coerce(float),
+                    vol.Range(min=0, max=MAX_TEMPERATURE_DEADBAND)
+                ),
+                vol.Optional(
+                    CONF_DOOR_DEADBAND,
+                    default=self.config_entry.options.get(
+                        CONF_DOOR_DEADBAND, DEFAULT_DOOR_DEADBAND
+                    ),
+                    description={"suffix": "seconds"},
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_DOOR_DEADBAND)
+                ),
+                vol.Optional(
+                    CONF_BATTERY_DEADBAND,
+                    default=self.config_entry.options.get(
+                        CONF_BATTERY_DEADBAND, DEFAULT_BATTERY_DEADBAND
+                    ),
+                    description={"suffix": "%"},
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_BATTERY_DEADBAND)
+                ),
+                vol.Optional(
+                    CONF_MIN_PUBLISH_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                    ),
+                    description={"suffix": "seconds"},
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_MIN_PUBLISH_INTERVAL)
+                ),
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(step_id="init", data_schema=data_schema, errors=errors)
 
 
 class CannotConnect(HomeAssistantError):
@@ -202,4 +372,8 @@ class CannotConnect(HomeAssistantError):
 
 
 class InvalidAuth(HomeAssistantError):
-    """Error to indicate there is invalid auth."""
\ No newline at end of file
+    """Error to indicate there is invalid auth."""
+
+
+class ValidationTimeout(HomeAssistantError):
+    """Error to indicate the Vitesy API did not answer in time."""
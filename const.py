@@ -2,8 +2,45 @@
 
 DOMAIN = "vitesy"
 
+# Sensor ids reported by the API that are exposed as entities
+SENSOR_TEMPERATURE = "TMP01-SY"
+SENSOR_DOOR = "DOT-SY"
+SENSOR_BATTERY = "battery"
+SENSOR_IDS = (SENSOR_TEMPERATURE, SENSOR_DOOR, SENSOR_BATTERY)
+
 # Configuration
 CONF_POLLING_INTERVAL = "polling_interval"
 DEFAULT_POLLING_INTERVAL = 300  # 5 minutes
 MIN_POLLING_INTERVAL = 60  # 1 minute
 MAX_POLLING_INTERVAL = 3600  # 1 hour
+
+# Config flow validation
+VALIDATION_TIMEOUT = 15  # seconds
+INVENTORY_CACHE_TTL = 300  # 5 minutes
+DATA_INVENTORY = "inventory"
+
+# Fleet mode
+CONF_FLEET_MODE = "fleet_mode"
+CONF_REQUESTS_PER_HOUR = "requests_per_hour"
+CONF_MAX_DATA_AGE = "max_data_age"
+DEFAULT_FLEET_MODE = False
+DEFAULT_REQUESTS_PER_HOUR = 600
+MIN_REQUESTS_PER_HOUR = 60
+MAX_REQUESTS_PER_HOUR = 36000
+DEFAULT_MAX_DATA_AGE = 3600  # 1 hour
+MIN_MAX_DATA_AGE = 300  # 5 minutes
+MAX_MAX_DATA_AGE = 86400  # 1 day
+
+# Publish filters
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_DOOR_DEADBAND = "door_deadband"
+CONF_BATTERY_DEADBAND = "battery_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+DEFAULT_TEMPERATURE_DEADBAND = 0.0  # disabled
+DEFAULT_DOOR_DEADBAND = 0  # disabled
+DEFAULT_BATTERY_DEADBAND = 0  # disabled
+DEFAULT_MIN_PUBLISH_INTERVAL = 0  # disabled
+MAX_TEMPERATURE_DEADBAND = 5.0  # °C
+MAX_DOOR_DEADBAND = 600  # 10 minutes
+MAX_BATTERY_DEADBAND = 50  # %
+MAX_MIN_PUBLISH_INTERVAL = 86400  # 1 day
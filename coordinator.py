@@ -1,28 +1,76 @@
 """Integration 101 Template integration using DataUpdateCoordinator."""
 
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
+import math
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_API_KEY,
 )
-from homeassistant.core import DOMAIN, HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from vitesy.client import VitesyClient
 
-from datetime import datetime
+from .const import (
+    CONF_BATTERY_DEADBAND,
+    CONF_DOOR_DEADBAND,
+    CONF_FLEET_MODE,
+    CONF_MAX_DATA_AGE,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_REQUESTS_PER_HOUR,
+    CONF_TEMPERATURE_DEADBAND,
+    DATA_INVENTORY,
+    DEFAULT_BATTERY_DEADBAND,
+    DEFAULT_DOOR_DEADBAND,
+    DEFAULT_FLEET_MODE,
+    DEFAULT_MAX_DATA_AGE,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_REQUESTS_PER_HOUR,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+    INVENTORY_CACHE_TTL,
+)
+from .models import VitesyDevice, VitesyMaintenance, VitesySensor
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def async_cache_inventory(hass: HomeAssistant, api_key: str, devices: list) -> None:
+    """Cache a device inventory fetched by the config flow for the first refresh."""
+    now = dt_util.utcnow()
+    cache = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_INVENTORY, {})
+    # Drop inventories from flows that were never completed
+    for key in [
+        key
+        for key, (fetched_at, _) in cache.items()
+        if now - fetched_at > timedelta(seconds=INVENTORY_CACHE_TTL)
+    ]:
+        cache.pop(key)
+    cache[api_key] = (now, devices)
+
+
+@callback
+def async_pop_inventory(hass: HomeAssistant, api_key: str) -> list | None:
+    """Return and remove the cached inventory for api_key if it is still fresh."""
+    cached = hass.data.get(DOMAIN, {}).get(DATA_INVENTORY, {}).pop(api_key, None)
+    if cached is None:
+        return None
+    fetched_at, devices = cached
+    if dt_util.utcnow() - fetched_at > timedelta(seconds=INVENTORY_CACHE_TTL):
+        return None
+    return devices
+
+
 @dataclass
 class VitesyAPIData:
     """Class to hold api data."""
 
-    devices: list
+    devices: dict[str, VitesyDevice]
 
 
 class VitesyCoordinator(DataUpdateCoordinator):
@@ -36,6 +84,46 @@ class VitesyCoordinator(DataUpdateCoordinator):
         self.api_key = config_entry.data[CONF_API_KEY]
         self.api_connected = False
 
+        # Fleet mode only queries a rotating shard of devices on each update
+        self.fleet_mode = self._get_option(config_entry, CONF_FLEET_MODE, DEFAULT_FLEET_MODE)
+        self.requests_per_hour = self._get_option(
+            config_entry, CONF_REQUESTS_PER_HOUR, DEFAULT_REQUESTS_PER_HOUR
+        )
+        self.max_data_age = timedelta(
+            seconds=self._get_option(config_entry, CONF_MAX_DATA_AGE, DEFAULT_MAX_DATA_AGE)
+        )
+        self._over_budget = False
+
+        update_interval = timedelta(seconds=60)
+        if self.fleet_mode:
+            # Each update needs the inventory request plus at least one device query
+            min_interval = timedelta(seconds=math.ceil(2 * 3600 / self.requests_per_hour))
+            if min_interval > update_interval:
+                _LOGGER.info(
+                    "Request budget of %s per hour only allows an update every %s",
+                    self.requests_per_hour,
+                    min_interval,
+                )
+                update_interval = min_interval
+
+        # Publish filters, sensors skip state writes for changes within these limits
+        self.deadbands = {
+            CONF_TEMPERATURE_DEADBAND: self._get_option(
+                config_entry, CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+            ),
+            CONF_DOOR_DEADBAND: self._get_option(
+                config_entry, CONF_DOOR_DEADBAND, DEFAULT_DOOR_DEADBAND
+            ),
+            CONF_BATTERY_DEADBAND: self._get_option(
+                config_entry, CONF_BATTERY_DEADBAND, DEFAULT_BATTERY_DEADBAND
+            ),
+        }
+        self.min_publish_interval = timedelta(
+            seconds=self._get_option(
+                config_entry, CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+            )
+        )
+
         # Initialise DataUpdateCoordinator
         super().__init__(
             hass,
@@ -45,7 +133,7 @@ class VitesyCoordinator(DataUpdateCoordinator):
             update_method=self.async_update_data,
             # Polling interval. Will only be polled if there are subscribers.
             # Using config option here but you can just use a value.
-            update_interval=timedelta(seconds=60),
+            update_interval=update_interval,
         )
 
         # Initialise your api here
@@ -53,50 +141,129 @@ class VitesyCoordinator(DataUpdateCoordinator):
             self.api = VitesyClient(api_key=self.api_key)
             self.api_connected = True
 
+    @staticmethod
+    def _get_option(config_entry: ConfigEntry, key: str, default):
+        """Return an option, falling back to the setup data and then the default."""
+        return config_entry.options.get(key, config_entry.data.get(key, default))
+
     async def async_update_data(self):
         _LOGGER.debug("vitesy async_update_data has been called")
+        now = dt_util.utcnow()
+        previous = self.data.devices if self.data else {}
         try:
-            devices = await self.hass.async_add_executor_job(self.api.get_devices)
-            _LOGGER.debug(f"Devices: {devices}")
-            
-            for device in devices:
-                sensors = [] # List to hold sensor data for each device
-                
+            # The config flow hands over the inventory it fetched while validating
+            raw_devices = None
+            if self.data is None:
+                raw_devices = async_pop_inventory(self.hass, self.api_key)
+            if raw_devices is None:
+                raw_devices = await self.hass.async_add_executor_job(self.api.get_devices)
+            _LOGGER.debug(f"Devices: {raw_devices}")
+
+            if self.fleet_mode:
+                shard = self._select_shard(raw_devices, previous, now)
+            else:
+                shard = {raw_device["id"] for raw_device in raw_devices}
+
+            devices: dict[str, VitesyDevice] = {}
+            for raw_device in raw_devices:
+                if raw_device["id"] not in shard:
+                    # Not due this cycle, keep the last readings with the fresh device info
+                    device = VitesyDevice.from_api(raw_device, None)
+                    if last := previous.get(device.id):
+                        device.sensors = last.sensors
+                        device.refreshed_at = last.refreshed_at
+                    devices[device.id] = device
+                    continue
+
                 data_in = await self.hass.async_add_executor_job(
-                    self.api.query_measurements, device["id"], None, None, None, True
+                    self.api.query_measurements, raw_device["id"], None, None, None, True
                 )
-                
-                if data_in and isinstance(data_in, list) and len(data_in) > 0:
-                    for sensor_data in data_in[0].get("sensors_data", []):
-                        sensors.append(sensor_data)
-                    for status_data in data_in[0].get("status_data", []):
-                        sensors.append(status_data)
-                else:
-                    _LOGGER.warning(f"No data for device: {device['id']}")
-                
-                device["sensors"] = sensors
-                
-                _LOGGER.debug(f"Device {device['id']} sensors: {sensors}")
+
+                if not (data_in and isinstance(data_in, list) and len(data_in) > 0):
+                    _LOGGER.warning(f"No data for device: {raw_device['id']}")
+                    data_in = None
+
+                # Keep only the parsed model, the raw payloads are dropped here
+                device = VitesyDevice.from_api(raw_device, data_in)
+                device.refreshed_at = now
+                devices[device.id] = device
+
+                _LOGGER.debug(f"Device {device.id} sensors: {device.sensors}")
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
-    
+
         return VitesyAPIData(devices)
 
-    def get_device_by_id(self, device_id: str):
+    def _select_shard(
+        self, raw_devices: list, previous: dict[str, VitesyDevice], now: datetime
+    ) -> set[str]:
+        """Return the ids of the devices to query on this update.
+
+        The shard size follows the hourly request budget, but is raised when
+        needed so that every device is refreshed within max_data_age. Devices
+        that would exceed max_data_age before the next update go first, then
+        devices that were never queried, then devices with alerts, then the
+        ones with the oldest data.
+        """
+        device_ids = [raw_device["id"] for raw_device in raw_devices]
+        if not device_ids:
+            return set()
+        # Alerts come from this update's inventory so new alerts move up right away
+        alerts = {raw_device["id"] for raw_device in raw_devices if raw_device.get("alerts")}
+
+        interval = self.update_interval.total_seconds()
+        # One request per update is spent on the device inventory
+        budget = max(math.floor(self.requests_per_hour * interval / 3600) - 1, 1)
+        # A device queried now must be queried again within this many updates
+        cycles = max(math.floor(self.max_data_age.total_seconds() / interval), 1)
+        required = math.ceil(len(device_ids) / cycles)
+        if required > budget and not self._over_budget:
+            _LOGGER.warning(
+                "Request budget of %s per hour is too low to refresh %s devices "
+                "every %s, querying %s devices per update instead of %s",
+                self.requests_per_hour,
+                len(device_ids),
+                self.max_data_age,
+                required,
+                budget,
+            )
+        self._over_budget = required > budget
+
+        def priority(device_id: str) -> tuple:
+            last = previous.get(device_id)
+            if last is None or last.refreshed_at is None:
+                return (1, False, datetime.min.replace(tzinfo=now.tzinfo))
+            # Count ages in whole updates so scheduling jitter does not make a
+            # device due one update early
+            age = round((now - last.refreshed_at).total_seconds() / interval)
+            overdue = age + 1 > cycles
+            return (0 if overdue else 2, device_id not in alerts, last.refreshed_at)
+
+        priorities = {device_id: priority(device_id) for device_id in device_ids}
+        ordered = sorted(device_ids, key=priorities.get)
+        overdue = sum(1 for key in priorities.values() if key[0] == 0)
+        size = max(budget, required, overdue)
+        shard = set(ordered[:size])
+        _LOGGER.debug("Querying %s of %s devices this update", len(shard), len(device_ids))
+        return shard
+
+    def get_device_by_id(self, device_id: str) -> VitesyDevice | None:
         """Return device by device id."""
         # Called by the binary sensors and sensors to get their updated data from self.data
-        try:
-            return [
-                device for device in self.data.devices if device.get('id') == device_id
-            ][0]
-        except IndexError:
-            return None
-        
-    def get_sensor_by_id(self, device_id: str, sensor_id: str):
+        return self.data.devices.get(device_id)
+
+    def get_sensor_by_id(self, device_id: str, sensor_id: str) -> VitesySensor | None:
         """Return sensor by sensor id."""
         device = self.get_device_by_id(device_id)
         if device:
-            return [
-                sensor for sensor in device.get('sensors', []) if sensor.get('id') == sensor_id
-            ][0]
+            return device.sensors.get(sensor_id)
+        return None
+
+    def get_maintenance_by_id(
+        self, device_id: str, maintenance_id: str
+    ) -> VitesyMaintenance | None:
+        """Return maintenance item by maintenance id."""
+        device = self.get_device_by_id(device_id)
+        if device:
+            return device.maintenance.get(maintenance_id)
         return None
@@ -0,0 +1,95 @@
+"""Unfiltered hourly statistics for sensors with publish filters."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class HourlyBucket:
+    """Running mean, min and max of the readings within one hour."""
+
+    start: datetime
+    total: float
+    count: int
+    min: float
+    max: float
+
+    def add(self, value: float) -> None:
+        """Add a reading to the bucket."""
+        self.total += value
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+class HourlyStatistics:
+    """Collect every reading of a sensor and write hourly external statistics.
+
+    The publish filters hold back small changes, so the recorder's own
+    statistics only see the filtered states. This keeps the unfiltered
+    hourly mean, min and max as an external statistic instead, which is
+    one row per hour and needs no state writes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_id: str,
+        sensor_id: str,
+        name: str,
+        unit: str | None,
+    ) -> None:
+        """Initialise the collector."""
+        self.hass = hass
+        self.metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{name} (unfiltered)",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{slugify(device_id)}_{slugify(sensor_id)}",
+            unit_of_measurement=unit,
+        )
+        self._bucket: HourlyBucket | None = None
+
+    def add(self, value: float, at: datetime) -> None:
+        """Add a reading, writing the previous hour once a new hour starts."""
+        start = at.replace(minute=0, second=0, microsecond=0)
+        if self._bucket is not None and self._bucket.start != start:
+            self.flush()
+        if self._bucket is None:
+            self._bucket = HourlyBucket(start, value, 1, value, value)
+        else:
+            self._bucket.add(value)
+
+    def flush(self) -> None:
+        """Write the current hour and start over."""
+        bucket, self._bucket = self._bucket, None
+        if bucket is None:
+            return
+        if "recorder" not in self.hass.config.components:
+            _LOGGER.debug("Recorder not loaded, dropping statistics of %s", self.metadata["statistic_id"])
+            return
+        async_add_external_statistics(
+            self.hass,
+            self.metadata,
+            [
+                StatisticData(
+                    start=bucket.start,
+                    mean=bucket.total / bucket.count,
+                    min=bucket.min,
+                    max=bucket.max,
+                )
+            ],
+        )
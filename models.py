@@ -0,0 +1,93 @@
+"""Compact data model for the Vitesy integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from typing import Any
+
+from .const import SENSOR_IDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class VitesySensor:
+    """Latest reading of a single device sensor or status value."""
+
+    id: str
+    value: float | None
+    timestamp: str | None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any], timestamp: str | None = None) -> VitesySensor:
+        """Build a sensor from a `sensors_data`/`status_data` entry.
+
+        A reading that is missing or not numeric gives a sensor without a value,
+        so one malformed entry does not fail the refresh of the whole account.
+        """
+        value = data.get("value")
+        avg = value.get("avg") if isinstance(value, dict) else None
+        try:
+            avg = float(avg) if avg is not None else None
+        except (TypeError, ValueError):
+            _LOGGER.debug("Ignoring non numeric value %r of sensor %s", avg, data.get("id"))
+            avg = None
+        return cls(id=data.get("id"), value=avg, timestamp=data.get("timestamp", timestamp))
+
+
+@dataclass(slots=True)
+class VitesyMaintenance:
+    """Maintenance item of a device, e.g. the filter."""
+
+    id: str
+    due_date: str | None
+
+    @classmethod
+    def from_api(cls, maintenance_id: str, data: dict[str, Any]) -> VitesyMaintenance:
+        """Build a maintenance item from a device `maintenance` entry."""
+        return cls(id=maintenance_id, due_date=data.get("due_date"))
+
+
+@dataclass(slots=True)
+class VitesyDevice:
+    """Device with the sensor values the integration exposes."""
+
+    id: str
+    firmware_version: str | None
+    sensors: dict[str, VitesySensor] = field(default_factory=dict)
+    maintenance: dict[str, VitesyMaintenance] = field(default_factory=dict)
+    refreshed_at: datetime | None = None
+
+    @classmethod
+    def from_api(
+        cls, device: dict[str, Any], measurements: list[dict[str, Any]] | None
+    ) -> VitesyDevice:
+        """Parse a device and its latest measurements.
+
+        Only the fields used by the entities are copied, so the raw
+        payloads can be released as soon as parsing is done.
+        """
+        sensors: dict[str, VitesySensor] = {}
+        if measurements:
+            latest = measurements[0]
+            timestamp = latest.get("timestamp")
+            for data in [*latest.get("sensors_data", []), *latest.get("status_data", [])]:
+                # Only the readings exposed as entities are parsed and kept
+                if isinstance(data, dict) and data.get("id") in SENSOR_IDS:
+                    sensor = VitesySensor.from_api(data, timestamp)
+                    sensors[sensor.id] = sensor
+
+        maintenance = {
+            maintenance_id: VitesyMaintenance.from_api(maintenance_id, data)
+            for maintenance_id, data in (device.get("maintenance") or {}).items()
+            if isinstance(data, dict)
+        }
+
+        return cls(
+            id=device.get("id"),
+            firmware_version=device.get("firmware_version"),
+            sensors=sensors,
+            maintenance=maintenance,
+        )
@@ -3,12 +3,13 @@
 import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from .sensor_temperature import FridgeTemperatureSensor
 from .sensor_battery import FridgeBatterySensor
 from .sensor_door import FridgeDoorSensor
+from .sensor_refresh import FridgeRefreshSensor
 # from .sensor_filter import FridgeFilterSensor
-from .const import DOMAIN
+from .const import DOMAIN, SENSOR_BATTERY, SENSOR_DOOR, SENSOR_TEMPERATURE
 from .coordinator import VitesyCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,27 +28,40 @@ async def async_setup_entry(
 
     # Enumerate all the sensors in your data value from your DataUpdateCoordinator and add an instance of your sensor class
     # to a list for each one.
-    # This maybe different in your specific case, depending on how your data is structured
-    sensors = []
-    for device in coordinator.data.devices:
-        _LOGGER.debug(f"Checking device: {device.get('id')}")
-        for sensor in device.get('sensors', []):
-            _LOGGER.debug(f"Checking sensor: {sensor.get('id')}")
-            if sensor.get('id') == "TMP01-SY":
-                sensors.append(FridgeTemperatureSensor(coordinator, device, sensor))
-            elif sensor.get('id') == "battery":
-                sensors.append(FridgeBatterySensor(coordinator, device, sensor))
-            elif sensor.get('id') == "DOT-SY":
-                sensors.append(FridgeDoorSensor(coordinator, device, sensor))
-
-        """
-        maintenance_data = device.get('maintenance', {})
-        for maintenance_type, maintenance_data in maintenance_data.items():
-            if maintenance_type == "filter":
-                sensors.append(FridgeFilterSensor(coordinator, device, maintenance_data))
-        """
-
-    # Create the sensors.
-    async_add_entities(sensors)
+    # In fleet mode devices get their first readings over several updates, so sensors are also
+    # added when a coordinator update brings readings for a device or sensor not seen before.
+    known: set[tuple[str, str]] = set()
 
+    @callback
+    def _async_add_new_sensors() -> None:
+        sensors = []
+        for device in coordinator.data.devices.values():
+            _LOGGER.debug(f"Checking device: {device.id}")
+            # Staleness only varies between devices in fleet mode
+            if coordinator.fleet_mode and (device.id, "last_refreshed") not in known and device.refreshed_at:
+                known.add((device.id, "last_refreshed"))
+                sensors.append(FridgeRefreshSensor(coordinator, device))
+            for sensor in device.sensors.values():
+                if (device.id, sensor.id) in known:
+                    continue
+                known.add((device.id, sensor.id))
+                _LOGGER.debug(f"Checking sensor: {sensor.id}")
+                if sensor.id == SENSOR_TEMPERATURE:
+                    sensors.append(FridgeTemperatureSensor(coordinator, device, sensor))
+                elif sensor.id == SENSOR_BATTERY:
+                    sensors.append(FridgeBatterySensor(coordinator, device, sensor))
+                elif sensor.id == SENSOR_DOOR:
+                    sensors.append(FridgeDoorSensor(coordinator, device, sensor))
 
+            """
+            for maintenance in device.maintenance.values():
+                if maintenance.id == "filter":
+                    sensors.append(FridgeFilterSensor(coordinator, device, maintenance))
+            """
+
+        # Create the sensors.
+        if sensors:
+            async_add_entities(sensors)
+
+    _async_add_new_sensors()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_sensors))
@@ -1,3 +1,4 @@
+from datetime import datetime
 import logging
 
 from homeassistant.components.sensor import (
@@ -9,33 +10,132 @@ from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import PERCENTAGE
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import VitesyCoordinator
+from .hourly_statistics import HourlyStatistics
+from .models import VitesyDevice, VitesySensor
 
 _LOGGER = logging.getLogger(__name__)
 
 class FridgeSensor(CoordinatorEntity, SensorEntity):
     """Implementation of a sensor."""
 
-    def __init__(self, coordinator: VitesyCoordinator, device: dict, sensor: dict) -> None:
+    # Option holding the deadband for this sensor type, None disables it
+    deadband_option: str | None = None
+
+    def __init__(self, coordinator: VitesyCoordinator, device: VitesyDevice, sensor: VitesySensor) -> None:
         """Initialise sensor."""
         super().__init__(coordinator)
-        self.device = device
-        self.sensor = sensor
-        
-        self.device_id = device.get('id')
-        self.sensor_id = sensor.get('id')
+        # Only the ids are kept, values are always read from the latest coordinator data
+        # so that older snapshots are not pinned in memory between refreshes.
+        self.device_id = device.id
+        self.sensor_id = sensor.id
+
+        # Last value written to the state machine, used by the publish filters
+        self._published_value: int | float | None = None
+        self._published_at: datetime | None = None
+
+        # Unfiltered hourly statistics, only kept while a publish filter is active
+        self._statistics: HourlyStatistics | None = None
+        self._collected_at: datetime | None = None
+
+    @property
+    def device(self) -> VitesyDevice | None:
+        """Return the device from the latest coordinator data."""
+        return self.coordinator.get_device_by_id(self.device_id)
+
+    @property
+    def sensor(self) -> VitesySensor | None:
+        """Return the sensor from the latest coordinator data."""
+        return self.coordinator.get_sensor_by_id(self.device_id, self.sensor_id)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
         # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_id(self.device_id)
-        _LOGGER.debug("_handle_coordinator_update Device: %s", self.device)
-        self.sensor = self.coordinator.get_sensor_by_id(self.device_id, self.sensor_id)
         _LOGGER.debug("_handle_coordinator_update Sensor: %s", self.sensor)
-        self.async_write_ha_state()
+        self._collect_statistics()
+        if self._should_publish():
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Record the initial state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._published_value = self.native_value
+        self._published_at = dt_util.utcnow()
+
+        if self._filters_enabled and self.state_class == SensorStateClass.MEASUREMENT:
+            self._statistics = HourlyStatistics(
+                self.hass,
+                self.device_id,
+                self.sensor_id,
+                self.name,
+                self.native_unit_of_measurement,
+            )
+            self._collect_statistics()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Write the statistics of the current hour."""
+        await super().async_will_remove_from_hass()
+        if self._statistics is not None:
+            self._statistics.flush()
+
+    @property
+    def _filters_enabled(self) -> bool:
+        """Return True if a publish filter applies to this sensor."""
+        return bool(
+            self.coordinator.deadbands.get(self.deadband_option, 0)
+            or self.coordinator.min_publish_interval
+        )
+
+    def _collect_statistics(self) -> None:
+        """Add the latest reading to the unfiltered hourly statistics.
+
+        Readings are only added when the device was queried again, so in fleet
+        mode the same reading is not counted on every update.
+        """
+        device = self.device
+        if self._statistics is None or device is None or device.refreshed_at is None:
+            return
+        if device.refreshed_at == self._collected_at:
+            return
+        value = self.native_value
+        if isinstance(value, (int, float)):
+            self._statistics.add(value, device.refreshed_at)
+            self._collected_at = device.refreshed_at
+
+    def _should_publish(self) -> bool:
+        """Return True if the latest value passes the deadband and publish interval.
+
+        Sub-threshold changes are held back to save recorder writes. The
+        latest value stays in the coordinator data and is published once it
+        moves far enough from the last written one, and every reading still
+        goes into the unfiltered hourly statistics.
+        """
+        deadband = self.coordinator.deadbands.get(self.deadband_option, 0)
+        min_interval = self.coordinator.min_publish_interval
+        value = self.native_value if self.available else None
+        now = dt_util.utcnow()
+
+        if not self._filters_enabled:
+            publish = True
+        elif value is None or self._published_value is None:
+            # Always publish going to or coming back from unavailable
+            publish = value != self._published_value or self._published_at is None
+        else:
+            if deadband:
+                publish = abs(value - self._published_value) >= deadband
+            else:
+                publish = value != self._published_value
+            if publish and self._published_at is not None:
+                publish = now - self._published_at >= min_interval
+
+        if publish:
+            self._published_value = value
+            self._published_at = now
+        return publish
 
     @property
     def device_class(self) -> str:
@@ -47,11 +147,12 @@ class FridgeSensor(CoordinatorEntity, SensorEntity):
         # Identifiers are what group entities into the same device.
         # If your device is created elsewhere, you can just specify the indentifiers parameter.
         # If your device connects via another device, add via_device parameter with the indentifiers of that device.
+        device = self.device
         return DeviceInfo(
             name=f"Shelfy{self.device_id}",
             manufacturer="Vitesy",
             model="Shelfy",
-            sw_version=self.device.get('firmware_version'),
+            sw_version=device.firmware_version if device else None,
             identifiers={
                 (
                     DOMAIN,
@@ -89,5 +190,6 @@ class FridgeSensor(CoordinatorEntity, SensorEntity):
         """Return the extra state attributes."""
         # Add any additional attributes you want on your sensor.
         attrs = {}
-        attrs["extra_info"] = self.sensor
+        sensor = self.sensor
+        attrs["timestamp"] = sensor.timestamp if sensor else None
         return attrs
\ No newline at end of file
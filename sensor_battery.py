@@ -6,12 +6,15 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import PERCENTAGE
 
+from .const import CONF_BATTERY_DEADBAND
 from .sensor_base import FridgeSensor
 _LOGGER = logging.getLogger(__name__)
 
 class FridgeBatterySensor(FridgeSensor):
     """Implementation of a sensor."""
 
+    deadband_option = CONF_BATTERY_DEADBAND
+
     @property
     def device_class(self) -> str:
         """Return device class."""
@@ -29,11 +32,12 @@ class FridgeBatterySensor(FridgeSensor):
         return PERCENTAGE
 
     @property
-    def native_value(self) -> int | float:
+    def native_value(self) -> int | float | None:
         """Return the state of the entity."""
         # Using native value and native unit of measurement, allows you to change units
         # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.sensor.get('value', {}).get('avg', None))
+        sensor = self.sensor
+        return sensor.value if sensor else None
 
     @property
     def state_class(self) -> str | None:
@@ -6,6 +6,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import UnitOfTime
 
+from .const import CONF_DOOR_DEADBAND
 from .coordinator import VitesyCoordinator
 from .sensor_base import FridgeSensor
 
@@ -13,6 +14,8 @@ _LOGGER = logging.getLogger(__name__)
 
 class FridgeDoorSensor(FridgeSensor):
 
+    deadband_option = CONF_DOOR_DEADBAND
+
     @property
     def device_class(self) -> str:
         """Return device class."""
@@ -30,11 +33,12 @@ class FridgeDoorSensor(FridgeSensor):
         return UnitOfTime.SECONDS
 
     @property
-    def native_value(self) -> int | float:
+    def native_value(self) -> int | float | None:
         """Return the state of the entity."""
         # Using native value and native unit of measurement, allows you to change units
         # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.sensor.get('value', {}).get('avg', None))
+        sensor = self.sensor
+        return sensor.value if sensor else None
 
     @property
     def state_class(self) -> str | None:
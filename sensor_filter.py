@@ -12,11 +12,17 @@ from homeassistant.const import DATETIME
 
 from .const import DOMAIN
 from .coordinator import VitesyCoordinator
+from .models import VitesyMaintenance
 from .sensor_base import FridgeSensor
 _LOGGER = logging.getLogger(__name__)
 
 class FridgeFilterSensor(FridgeSensor):
 
+    @property
+    def sensor(self) -> VitesyMaintenance | None:
+        """Return the maintenance item from the latest coordinator data."""
+        return self.coordinator.get_maintenance_by_id(self.device_id, self.sensor_id)
+
     @property
     def device_class(self) -> str:
         """Return device class."""
@@ -38,7 +44,13 @@ class FridgeFilterSensor(FridgeSensor):
         """Return the state of the entity."""
         # Using native value and native unit of measurement, allows you to change units
         # in Lovelace and HA will automatically calculate the correct value.
-        return self.sensor.get('due_date', None)
+        sensor = self.sensor
+        return sensor.due_date if sensor else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the extra state attributes."""
+        return {}
 
     @property
     def state_class(self) -> str | None:
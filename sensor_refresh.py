@@ -0,0 +1,55 @@
+import logging
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import EntityCategory
+
+from .coordinator import VitesyCoordinator
+from .models import VitesyDevice, VitesySensor
+from .sensor_base import FridgeSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+class FridgeRefreshSensor(FridgeSensor):
+    """Time the device was last queried, not subject to the publish filters."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: VitesyCoordinator, device: VitesyDevice) -> None:
+        """Initialise sensor."""
+        super().__init__(coordinator, device, VitesySensor("last_refreshed", None, None))
+
+    def _should_publish(self) -> bool:
+        """Always publish, this sensor tracks staleness when other sensors are held back."""
+        return True
+
+    @property
+    def device_class(self) -> str:
+        """Return device class."""
+        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return f"FridgeLastRefreshed{self.device_id}"
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return unit of measurement."""
+        return None
+
+    @property
+    def native_value(self):
+        """Return the state of the entity."""
+        device = self.device
+        return device.refreshed_at if device else None
+
+    @property
+    def state_class(self) -> str | None:
+        """Return state class."""
+        return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the extra state attributes."""
+        return {}
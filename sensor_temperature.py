@@ -10,13 +10,15 @@ from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_TEMPERATURE_DEADBAND, DOMAIN
 from .coordinator import VitesyCoordinator
 from .sensor_base import FridgeSensor
 _LOGGER = logging.getLogger(__name__)
 
 class FridgeTemperatureSensor(FridgeSensor):
 
+    deadband_option = CONF_TEMPERATURE_DEADBAND
+
     @property
     def device_class(self) -> str:
         """Return device class."""
@@ -29,11 +31,12 @@ class FridgeTemperatureSensor(FridgeSensor):
         return f"FridgeTemperature{self.device_id}-{self.sensor_id}"
 
     @property
-    def native_value(self) -> int | float:
+    def native_value(self) -> int | float | None:
         """Return the state of the entity."""
         # Using native value and native unit of measurement, allows you to change units
         # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.sensor.get('value', {}).get('avg', None))
+        sensor = self.sensor
+        return sensor.value if sensor else None
 
     @property
     def native_unit_of_measurement(self) -> str | None: